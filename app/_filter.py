@@ -0,0 +1,25 @@
+"""
+Numeric validation kernels for columnar chunks.
+
+Compiled with Numba when it is installed (the `jit` extra); otherwise the
+same predicates fall back to plain NumPy expressions. Keep these kernels
+purely numeric - string work belongs in the calling processor.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    def clean_mask(present: np.ndarray, vals: np.ndarray) -> np.ndarray:
+        """Rows with an id present and a value that is not negative (NaN passes)."""
+        return present & ~(vals < 0.0)
+else:
+    # No fastmath: it lets LLVM assume no NaNs and fold `not v < 0` into `v >= 0`
+    @njit(cache=True, parallel=True)
+    def clean_mask(present, vals):
+        """Rows with an id present and a value that is not negative (NaN passes)."""
+        out = np.empty(present.shape[0], np.bool_)
+        for i in prange(present.shape[0]):
+            out[i] = present[i] and not (vals[i] < 0.0)
+        return out
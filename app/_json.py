@@ -0,0 +1,30 @@
+"""
+JSON encoding for the file readers and writers.
+
+Uses orjson when it is installed; otherwise falls back to the standard
+library with the same compact, UTF-8 byte output. Both `dumps` variants
+return bytes and `loads` accepts bytes, so callers stay byte-native.
+"""
+
+try:
+    import orjson
+except ImportError:
+    import json
+
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(obj) -> bytes:
+        return _encoder.encode(obj).encode()
+
+    def dumps_line(obj) -> bytes:
+        """Encode `obj` as one JSON Lines record (trailing newline included)."""
+        return _encoder.encode(obj).encode() + b'\n'
+
+    loads = json.loads
+else:
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+    def dumps_line(obj) -> bytes:
+        """Encode `obj` as one JSON Lines record (trailing newline included)."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
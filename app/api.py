@@ -1,54 +1,66 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from sqlmodel import Session, select
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI, HTTPException, Depends
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Dict, Any
 
-from app.database import create_db_and_tables, engine
-from app.models import JobInstance, JobExecution, StepExecution
+from app.database import create_db_and_tables, get_session
+from app.models import JobInstance, JobExecution, StepExecution, JobParameter
 from app.core import JobLauncher
 from app.jobs import job_registry
+from app.log import logger
 
 app = FastAPI()
 
+# Jobs run on a dedicated pool so long-running steps never hold up the API worker
+job_workers = 4
+executor = ThreadPoolExecutor(max_workers=job_workers, thread_name_prefix="batch-job")
+
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
 
+@app.on_event("shutdown")
+def on_shutdown():
+    executor.shutdown(wait=False)
+
+def _log_launch_failure(job_name: str, future: asyncio.Future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Job %s failed to launch", job_name, exc_info=future.exception())
+
 @app.post("/jobs/{job_name}/launch")
-def launch_job(job_name: str, parameters: Dict[str, Any] = None, force: bool = False, background_tasks: BackgroundTasks = None):
-    if job_name not in job_registry:
+async def launch_job(job_name: str, parameters: Dict[str, Any] = None, force: bool = False):
+    job = job_registry.get(job_name)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = job_registry[job_name]
     launcher = JobLauncher()
     
-    # Run in background
-    background_tasks.add_task(launcher.run_job, job, parameters, force)
+    # Run in background; errors raised before the job's own handling are logged here
+    future = asyncio.get_running_loop().run_in_executor(executor, launcher.run_job, job, parameters, force)
+    future.add_done_callback(lambda f: _log_launch_failure(job_name, f))
     
     return {"message": "Job submitted", "job_name": job_name}
 
 @app.get("/executions")
-def list_executions():
-    with Session(engine) as session:
-        executions = session.exec(select(JobExecution)).all()
-        return executions
+async def list_executions(session: AsyncSession = Depends(get_session)):
+    executions = (await session.exec(select(JobExecution))).all()
+    return executions
 
 @app.get("/executions/{execution_id}")
-def get_execution(execution_id: int):
-    with Session(engine) as session:
-        execution = session.get(JobExecution, execution_id)
-        if not execution:
-            raise HTTPException(status_code=404, detail="Execution not found")
-        return execution
+async def get_execution(execution_id: int, session: AsyncSession = Depends(get_session)):
+    execution = await session.get(JobExecution, execution_id)
+    if not execution:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    return execution
 
 @app.get("/executions/{execution_id}/steps")
-def list_execution_steps(execution_id: int):
-    with Session(engine) as session:
-        steps = session.exec(select(StepExecution).where(StepExecution.job_execution_id == execution_id)).all()
-        return steps
+async def list_execution_steps(execution_id: int, session: AsyncSession = Depends(get_session)):
+    steps = (await session.exec(select(StepExecution).where(StepExecution.job_execution_id == execution_id))).all()
+    return steps
 
 @app.get("/instances/{instance_id}/parameters")
-def get_job_parameters(instance_id: int):
-    with Session(engine) as session:
-        from app.models import JobParameter
-        params = session.exec(select(JobParameter).where(JobParameter.job_instance_id == instance_id)).all()
-        return params
+async def get_job_parameters(instance_id: int, session: AsyncSession = Depends(get_session)):
+    params = (await session.exec(select(JobParameter).where(JobParameter.job_instance_id == instance_id))).all()
+    return params
@@ -1,5 +1,9 @@
 from typing import TypeVar, Generic, List, Optional, Callable, Any, Iterator
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import islice
+import numpy as np
+from sqlmodel import Session
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -11,6 +15,11 @@ class ItemReader(ABC, Generic[T]):
     def read(self) -> Optional[T]:
         """Read the next item. Return None when no more items are available."""
         pass
+    
+    def read_chunk(self, size: int) -> List[T]:
+        """Read up to `size` items. Override to fetch a whole chunk in one call."""
+        # iter(read, None) stops at the None sentinel without a Python-level loop
+        return list(islice(iter(self.read, None), size))
 
 class ItemProcessor(ABC, Generic[T, U]):
     """Abstract base class for processing items."""
@@ -19,6 +28,10 @@ class ItemProcessor(ABC, Generic[T, U]):
     def process(self, item: T) -> Optional[U]:
         """Process an item. Return None to filter out the item."""
         pass
+    
+    def process_batch(self, items: List[T]) -> List[U]:
+        """Process a whole chunk, dropping filtered items. Override to process in bulk."""
+        return [result for result in map(self.process, items) if result is not None]
 
 class ItemWriter(ABC, Generic[U]):
     """Abstract base class for writing items."""
@@ -28,6 +41,36 @@ class ItemWriter(ABC, Generic[U]):
         """Write a chunk of items."""
         pass
 
+class AsyncItemReader(ABC, Generic[T]):
+    """Abstract base class for reading items from async sources (DB, HTTP, ...)."""
+    
+    @abstractmethod
+    async def read(self) -> Optional[T]:
+        """Read the next item. Return None when no more items are available."""
+        pass
+    
+    async def read_chunk(self, size: int) -> List[T]:
+        """Read up to `size` items. Override to fetch a whole chunk in one call."""
+        chunk = []
+        for _ in range(size):
+            item = await self.read()
+            if item is None:
+                break
+            chunk.append(item)
+        return chunk
+
+class AsyncItemWriter(ABC, Generic[U]):
+    """Abstract base class for writing items to async sinks."""
+    
+    @abstractmethod
+    async def write(self, items: List[U]) -> None:
+        """Write a chunk of items."""
+        pass
+    
+    async def close(self) -> None:
+        """Release the sink. Awaited once when the step ends."""
+        pass
+
 # Concrete implementations for common use cases
 
 class ListItemReader(ItemReader[T]):
@@ -35,14 +78,13 @@ class ListItemReader(ItemReader[T]):
     
     def __init__(self, items: List[T]):
         self.items = items
-        self.index = 0
+        self._it = iter(items)
     
     def read(self) -> Optional[T]:
-        if self.index < len(self.items):
-            item = self.items[self.index]
-            self.index += 1
-            return item
-        return None
+        return next(self._it, None)
+    
+    def read_chunk(self, size: int) -> List[T]:
+        return list(islice(self._it, size))
 
 class CallableItemReader(ItemReader[T]):
     """Reads items using a callable that returns an iterator."""
@@ -51,10 +93,10 @@ class CallableItemReader(ItemReader[T]):
         self.iterator = callable_source()
     
     def read(self) -> Optional[T]:
-        try:
-            return next(self.iterator)
-        except StopIteration:
-            return None
+        return next(self.iterator, None)
+    
+    def read_chunk(self, size: int) -> List[T]:
+        return list(islice(self.iterator, size))
 
 class FunctionItemProcessor(ItemProcessor[T, U]):
     """Processes items using a function."""
@@ -65,6 +107,82 @@ class FunctionItemProcessor(ItemProcessor[T, U]):
     def process(self, item: T) -> Optional[U]:
         return self.process_func(item)
 
+class NumpyBatchProcessor(ItemProcessor[T, U]):
+    """Processes a whole chunk at once with a vectorized NumPy function.
+    
+    `batch_func` receives the chunk as an array and returns an array of the
+    processed items; items are filtered out by leaving them out of the result.
+    """
+    
+    def __init__(self, batch_func: Callable[[np.ndarray], np.ndarray], dtype=None):
+        self.batch_func = batch_func
+        self.dtype = dtype
+    
+    def process_batch(self, items: List[T]) -> List[U]:
+        return self.batch_func(np.asarray(items, dtype=self.dtype)).tolist()
+    
+    def process(self, item: T) -> Optional[U]:
+        result = self.process_batch([item])
+        return result[0] if result else None
+
+@lru_cache(maxsize=None)
+def _numba_kernels(process_func: Callable):
+    """Compile `process_func` and its parallel map loop once per process.
+    
+    The map loop closes over the compiled function, and Numba can't reuse an
+    on-disk cache entry for a closure, so these are memoized in memory instead.
+    """
+    import numba
+    
+    func = numba.njit(cache=True)(process_func)
+    
+    @numba.njit(parallel=True)
+    def process_array(items, out):
+        for i in numba.prange(items.shape[0]):
+            out[i] = func(items[i])
+        return out
+    
+    return func, process_array
+
+class NumbaItemProcessor(ItemProcessor[T, U]):
+    """Processes numeric items with a Numba-compiled scalar function.
+    
+    `process_func` must be Numba-compatible and return `sentinel` instead of
+    None for items that should be filtered out. Whole chunks run through a
+    parallel `prange` loop. The output dtype is the function's compiled
+    return type for `dtype` inputs unless `out_dtype` is given. Requires the
+    optional `numba` dependency.
+    """
+    
+    def __init__(self, process_func: Callable[[T], U], sentinel=np.iinfo(np.int64).min, dtype=np.int64, out_dtype=None):
+        import numba
+        from numba.core.errors import NumbaNotImplementedError
+        from numba.np.numpy_support import as_dtype
+        
+        self.sentinel = sentinel
+        self.dtype = np.dtype(dtype)
+        self.process_func, self._process_array = _numba_kernels(process_func)
+        
+        if out_dtype is None:
+            # Compile for the input dtype now so the batch output keeps the function's result type
+            arg_type = numba.from_dtype(self.dtype)
+            self.process_func.compile((arg_type,))
+            return_type = next(sig.return_type for sig in self.process_func.nopython_signatures if sig.args == (arg_type,))
+            try:
+                out_dtype = as_dtype(return_type)
+            except NumbaNotImplementedError:
+                raise TypeError(f"process_func returns {return_type}, which has no NumPy dtype; pass out_dtype") from None
+        self.out_dtype = np.dtype(out_dtype)
+    
+    def process_batch(self, items: List[T]) -> List[U]:
+        items = np.asarray(items, dtype=self.dtype)
+        out = self._process_array(items, np.empty(items.shape[0], dtype=self.out_dtype))
+        return out[out != self.sentinel].tolist()
+    
+    def process(self, item: T) -> Optional[U]:
+        result = self.process_func(item)
+        return None if result == self.sentinel else result
+
 class ListItemWriter(ItemWriter[U]):
     """Writes items to a list (for testing/demo purposes)."""
     
@@ -83,8 +201,23 @@ class CallableItemWriter(ItemWriter[U]):
     def write(self, items: List[U]) -> None:
         self.write_func(items)
 
+class SQLAlchemyItemWriter(ItemWriter[U]):
+    """Writes ORM objects to a database with a single bulk save per chunk."""
+    
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def write(self, items: List[U]) -> None:
+        with Session(self.engine) as session:
+            session.bulk_save_objects(items)
+            session.commit()
+
 class PassThroughProcessor(ItemProcessor[T, T]):
     """A processor that doesn't modify items (identity function)."""
     
     def process(self, item: T) -> Optional[T]:
         return item
+    
+    def process_batch(self, items: List[T]) -> List[T]:
+        # Nothing to transform or filter: hand the chunk straight to the writer
+        return items
@@ -1,10 +1,19 @@
-import traceback
+import asyncio
+import inspect
 import time
-from datetime import datetime
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Callable, Any, Union
-from sqlmodel import Session, select
+import orjson
+from sqlalchemy import bindparam, lambda_stmt
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select, update, insert
 from app.models import JobInstance, JobExecution, StepExecution, BatchStatus, JobParameter
-from app.database import engine
+from app.database import session_maker
+from app.log import logger
 
 class Step:
     def __init__(self, name: str, task: Callable[..., Any], max_retries: int = 0, retry_delay: float = 1.0):
@@ -18,8 +27,10 @@ class ChunkStep:
     """A step that processes data in chunks using reader, processor, and writer."""
     
     def __init__(self, name: str, reader, processor=None, writer=None, 
-                 chunk_size: int = 10, max_retries: int = 0, retry_delay: float = 1.0,
-                 skip_policy=None):
+                 chunk_size: int = 1000, max_retries: int = 0, retry_delay: float = 1.0,
+                 skip_policy=None, commit_interval: int = 10):
+        if commit_interval < 1:
+            raise ValueError(f"commit_interval must be at least 1, got {commit_interval}")
         self.name = name
         self.reader = reader
         self.processor = processor
@@ -28,13 +39,88 @@ class ChunkStep:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.skip_policy = skip_policy
+        self.commit_interval = commit_interval  # chunks per metadata commit
         self.is_chunk_step = True
 
+class ParallelStepGroup:
+    """A group of independent steps that run concurrently in a thread pool.
+    
+    Threads suit I/O-bound steps. CPU-bound Python steps are serialized by the
+    GIL and gain little here; run them as separate jobs or move the heavy work
+    into a ProcessPoolExecutor inside the step.
+    """
+    
+    def __init__(self, steps: List[Union[Step, ChunkStep]], max_workers: int = 4):
+        self.name = "+".join(step.name for step in steps)
+        self.steps = steps
+        self.max_workers = max_workers
+        self.is_parallel_group = True
+
+class ChunkMetrics:
+    """Chunk counters kept in memory and flushed to the StepExecution row at commit points.
+    
+    Also tracks the step's effective commit interval, which shrinks when the
+    database reports lock contention.
+    """
+    
+    COUNTERS = ("read_count", "write_count", "filter_count", "commit_count")
+    __slots__ = COUNTERS + ("commit_interval",)
+    
+    def __init__(self, commit_interval: int):
+        self.read_count = 0
+        self.write_count = 0
+        self.filter_count = 0
+        self.commit_count = 0
+        self.commit_interval = commit_interval
+    
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.COUNTERS}
+
 class Job:
-    def __init__(self, name: str, steps: List[Union[Step, ChunkStep]]):
+    def __init__(self, name: str, steps: List[Union[Step, ChunkStep, ParallelStepGroup]]):
         self.name = name
         self.steps = steps
 
+# Counter update issued at every chunk commit point, built once so its SQL is compiled once
+UPDATE_STEP_COUNTERS = lambda_stmt(
+    lambda: update(StepExecution)
+    .where(StepExecution.id == bindparam("sid"))
+    .values(
+        read_count=bindparam("r"),
+        write_count=bindparam("w"),
+        filter_count=bindparam("f"),
+        commit_count=bindparam("c"),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+# JobParameter column used to store each parameter type
+PARAMETER_COLUMNS = {
+    str: "string_value",
+    datetime: "date_value",
+    int: "long_value",
+    bool: "long_value",
+    float: "double_value",
+}
+
+def _job_key(parameters: dict) -> str:
+    """Stable 32-character key identifying a job instance by its parameters."""
+    canonical = orjson.dumps(parameters, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+@lru_cache(maxsize=1024)
+def _find_job_instance_id(job_name: str, job_key: str) -> int:
+    """Look up a JobInstance id. Misses raise LookupError, which lru_cache does not cache."""
+    with session_maker() as session:
+        statement = select(JobInstance.id).where(
+            JobInstance.job_name == job_name,
+            JobInstance.job_key == job_key
+        )
+        job_instance_id = session.exec(statement).first()
+    if job_instance_id is None:
+        raise LookupError(f"No job instance for {job_name}")
+    return job_instance_id
+
 class JobLauncher:
     def __init__(self):
         pass
@@ -43,57 +129,53 @@ class JobLauncher:
         if parameters is None:
             parameters = {}
         
-        # Simple key generation based on sorted parameters
-        job_key = str(sorted(parameters.items()))
+        job_key = _job_key(parameters)
         
-        with Session(engine) as session:
-            # 1. Find or Create JobInstance
-            statement = select(JobInstance).where(
-                JobInstance.job_name == job.name,
-                JobInstance.job_key == job_key
-            )
-            job_instance = session.exec(statement).first()
-            
-            if not job_instance:
+        with session_maker() as session:
+            # 1. Find or Create JobInstance (lookups are cached per name/key)
+            try:
+                job_instance_id = _find_job_instance_id(job.name, job_key)
+            except LookupError:
                 job_instance = JobInstance(job_name=job.name, job_key=job_key)
                 session.add(job_instance)
                 session.commit()
-                session.refresh(job_instance)
+                job_instance_id = job_instance.id
                 
                 # Save parameters
-                self._save_parameters(session, job_instance.id, parameters)
+                self._save_parameters(session, job_instance_id, parameters)
             
             # Check for already completed steps for this instance
             completed_steps = set()
             if not force:
-                statement = select(StepExecution.step_name).join(JobExecution).where(
-                    JobExecution.job_instance_id == job_instance.id,
+                execution_ids = select(JobExecution.id).where(
+                    JobExecution.job_instance_id == job_instance_id
+                )
+                statement = select(StepExecution.step_name).where(
+                    StepExecution.job_execution_id.in_(execution_ids),
                     StepExecution.status == BatchStatus.COMPLETED
                 )
-                results = session.exec(statement).all()
-                completed_steps.update(results)
+                completed_steps = set(session.exec(statement))
 
             # 2. Create JobExecution
             job_execution = JobExecution(
-                job_instance_id=job_instance.id,
+                job_instance_id=job_instance_id,
                 status=BatchStatus.STARTED,
                 start_time=datetime.utcnow()
             )
             session.add(job_execution)
             session.commit()
-            session.refresh(job_execution)
             
             try:
                 for step in job.steps:
+                    if getattr(step, 'is_parallel_group', False):
+                        self._run_parallel_group(job_execution.id, step, completed_steps)
+                        continue
+                    
                     if step.name in completed_steps:
-                        print(f"Skipping step {step.name} as it is already complete.")
+                        logger.info("Skipping step %s as it is already complete.", step.name)
                         continue
                     
-                    # Check if it's a chunk step or regular step
-                    if hasattr(step, 'is_chunk_step') and step.is_chunk_step:
-                        self._run_chunk_step(session, job_execution, step)
-                    else:
-                        self._run_step(session, job_execution, step)
+                    self._execute_step(session, job_execution.id, step)
                 
                 job_execution.status = BatchStatus.COMPLETED
                 job_execution.exit_code = "COMPLETED"
@@ -101,8 +183,7 @@ class JobLauncher:
                 job_execution.status = BatchStatus.FAILED
                 job_execution.exit_code = "FAILED"
                 job_execution.exit_message = str(e)
-                print(f"Job failed: {e}")
-                traceback.print_exc()
+                logger.exception("Job failed: %s", e)
             finally:
                 job_execution.end_time = datetime.utcnow()
                 session.add(job_execution)
@@ -111,28 +192,61 @@ class JobLauncher:
             return job_execution
 
     def _save_parameters(self, session: Session, job_instance_id: int, parameters: dict):
-        """Save job parameters to the database with type detection."""
+        """Save job parameters to the database with type detection, as one bulk insert."""
+        rows = []
         for key, value in parameters.items():
-            param = JobParameter(job_instance_id=job_instance_id, key_name=key)
-            
-            if isinstance(value, str):
-                param.string_value = value
-            elif isinstance(value, datetime):
-                param.date_value = value
-            elif isinstance(value, int):
-                param.long_value = value
-            elif isinstance(value, float):
-                param.double_value = value
-            else:
+            row = {
+                "job_instance_id": job_instance_id,
+                "key_name": key,
+                "string_value": None,
+                "date_value": None,
+                "long_value": None,
+                "double_value": None,
+            }
+            column = PARAMETER_COLUMNS.get(type(value))
+            if column is None:
                 # Default to string representation
-                param.string_value = str(value)
-            
-            session.add(param)
+                column, value = "string_value", str(value)
+            row[column] = value
+            rows.append(row)
+        
+        if rows:
+            session.execute(insert(JobParameter), rows)
         session.commit()
 
-    def _run_step(self, session: Session, job_execution: JobExecution, step: Step):
+    def _execute_step(self, session: Session, job_execution_id: int, step):
+        # Check if it's a chunk step or regular step
+        if hasattr(step, 'is_chunk_step') and step.is_chunk_step:
+            self._run_chunk_step(session, job_execution_id, step)
+        else:
+            self._run_step(session, job_execution_id, step)
+
+    def _run_parallel_group(self, job_execution_id: int, group: ParallelStepGroup, completed_steps: set):
+        """Run the steps of a group concurrently, each with its own session."""
+        steps = []
+        for step in group.steps:
+            if step.name in completed_steps:
+                logger.info("Skipping step %s as it is already complete.", step.name)
+            else:
+                steps.append(step)
+        if not steps:
+            return
+        
+        def run_in_session(step):
+            with session_maker() as session:
+                self._execute_step(session, job_execution_id, step)
+        
+        with ThreadPoolExecutor(max_workers=min(len(steps), group.max_workers)) as executor:
+            futures = [executor.submit(run_in_session, step) for step in steps]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                future.result()  # Re-raise the first failure to stop the job
+
+    def _run_step(self, session: Session, job_execution_id: int, step: Step):
         step_execution = StepExecution(
-            job_execution_id=job_execution.id,
+            job_execution_id=job_execution_id,
             step_name=step.name,
             status=BatchStatus.STARTED,
             start_time=datetime.utcnow(),
@@ -140,7 +254,6 @@ class JobLauncher:
         )
         session.add(step_execution)
         session.commit()
-        session.refresh(step_execution)
         
         retry_count = 0
         last_exception = None
@@ -163,11 +276,11 @@ class JobLauncher:
                 retry_count += 1
                 
                 if retry_count <= step.max_retries:
-                    print(f"Step {step.name} failed (attempt {retry_count}/{step.max_retries + 1}). Retrying in {step.retry_delay}s...")
+                    logger.warning("Step %s failed (attempt %d/%d). Retrying in %ss...", step.name, retry_count, step.max_retries + 1, step.retry_delay)
                     time.sleep(step.retry_delay)
                 else:
                     # All retries exhausted
-                    print(f"Step {step.name} failed after {retry_count} attempts.")
+                    logger.error("Step %s failed after %d attempts.", step.name, retry_count)
                     step_execution.status = BatchStatus.FAILED
                     step_execution.exit_code = "FAILED"
                     step_execution.exit_message = str(e)
@@ -177,15 +290,19 @@ class JobLauncher:
                     session.commit()
                     raise e  # Re-raise to stop the job
 
-    def _run_chunk_step(self, session: Session, job_execution: JobExecution, step):
+    def _run_chunk_step(self, session: Session, job_execution_id: int, step):
         """Execute a chunk-oriented step with read-process-write cycle."""
-        from app.chunk import PassThroughProcessor
+        from app.chunk import PassThroughProcessor, AsyncItemReader, AsyncItemWriter
+        
+        # Wall-clock time is taken once; the end time is derived from a monotonic clock
+        start_time = datetime.utcnow()
+        started = time.monotonic()
         
         step_execution = StepExecution(
-            job_execution_id=job_execution.id,
+            job_execution_id=job_execution_id,
             step_name=step.name,
             status=BatchStatus.STARTED,
-            start_time=datetime.utcnow(),
+            start_time=start_time,
             retry_count=0,
             read_count=0,
             write_count=0,
@@ -194,76 +311,179 @@ class JobLauncher:
         )
         session.add(step_execution)
         session.commit()
-        session.refresh(step_execution)
         
         # Use PassThroughProcessor if no processor specified
         processor = step.processor if step.processor else PassThroughProcessor()
+        # The batch hook is resolved once per step rather than looked up every chunk
+        process_batch = self._resolve_process_batch(processor)
+        
+        # Async readers/writers run through a pipeline that overlaps reads and writes
+        is_async = isinstance(step.reader, AsyncItemReader) or isinstance(step.writer, AsyncItemWriter)
+        
+        # Counters live in memory during the chunk loop and are written with a
+        # Core UPDATE at commit points instead of flushing the ORM row each chunk
+        metrics = ChunkMetrics(step.commit_interval)
         
         retry_count = 0
         
-        while retry_count <= step.max_retries:
-            try:
-                # Process items in chunks
-                while True:
-                    chunk = []
-                    
-                    # Read a chunk
-                    for _ in range(step.chunk_size):
-                        item = step.reader.read()
-                        if item is None:
-                            break
-                        chunk.append(item)
-                        step_execution.read_count += 1
-                    
-                    if not chunk:
-                        break  # No more items to process
-                    
-                    # Process the chunk
-                    processed_chunk = []
-                    for item in chunk:
-                        processed_item = processor.process(item)
-                        if processed_item is not None:
-                            processed_chunk.append(processed_item)
-                        else:
-                            step_execution.filter_count += 1
-                    
-                    # Write the processed chunk
-                    if processed_chunk and step.writer:
-                        step.writer.write(processed_chunk)
-                        step_execution.write_count += len(processed_chunk)
-                    
-                    step_execution.commit_count += 1
+        try:
+            while retry_count <= step.max_retries:
+                try:
+                    # Process items in chunks
+                    if is_async:
+                        asyncio.run(self._run_chunks_async(session, step_execution.id, step, process_batch, metrics))
+                    else:
+                        self._run_chunks(session, step_execution.id, step, process_batch, metrics)
                     
-                    # Commit after each chunk
+                    # Step completed successfully
+                    self._apply_metrics(step_execution, metrics)
+                    step_execution.status = BatchStatus.COMPLETED
+                    step_execution.exit_code = "COMPLETED"
+                    step_execution.retry_count = retry_count
+                    step_execution.end_time = start_time + timedelta(seconds=time.monotonic() - started)
                     session.add(step_execution)
                     session.commit()
-                
-                # Step completed successfully
-                step_execution.status = BatchStatus.COMPLETED
-                step_execution.exit_code = "COMPLETED"
-                step_execution.retry_count = retry_count
-                step_execution.end_time = datetime.utcnow()
-                session.add(step_execution)
-                session.commit()
-                return
-                
-            except Exception as e:
-                retry_count += 1
-                
-                if retry_count <= step.max_retries:
-                    print(f"Chunk step {step.name} failed (attempt {retry_count}/{step.max_retries + 1}). Retrying in {step.retry_delay}s...")
-                    time.sleep(step.retry_delay)
-                    # Reset reader if possible
-                    if hasattr(step.reader, 'reset'):
-                        step.reader.reset()
+                    return
+                    
+                except Exception as e:
+                    retry_count += 1
+                    
+                    if retry_count <= step.max_retries:
+                        logger.warning("Chunk step %s failed (attempt %d/%d). Retrying in %ss...", step.name, retry_count, step.max_retries + 1, step.retry_delay)
+                        time.sleep(step.retry_delay)
+                        # Reset reader if possible
+                        if hasattr(step.reader, 'reset'):
+                            step.reader.reset()
+                    else:
+                        # All retries exhausted
+                        logger.error("Chunk step %s failed after %d attempts.", step.name, retry_count)
+                        self._apply_metrics(step_execution, metrics)
+                        step_execution.status = BatchStatus.FAILED
+                        step_execution.exit_code = "FAILED"
+                        step_execution.exit_message = str(e)
+                        step_execution.retry_count = retry_count - 1
+                        step_execution.end_time = start_time + timedelta(seconds=time.monotonic() - started)
+                        session.add(step_execution)
+                        session.commit()
+                        raise e
+        finally:
+            # Writers holding resources (files, connections) are closed at step end;
+            # an async close() gets its own event loop, like the async chunk loop
+            close = getattr(step.writer, 'close', None)
+            if close is not None:
+                if inspect.iscoroutinefunction(close):
+                    asyncio.run(close())
                 else:
-                    # All retries exhausted
-                    print(f"Chunk step {step.name} failed after {retry_count} attempts.")
-                    step_execution.status = BatchStatus.FAILED
-                    step_execution.exit_code = "FAILED"
-                    step_execution.exit_message = str(e)
-                    step_execution.retry_count = retry_count - 1
-                    step_execution.end_time = datetime.utcnow()
-                    session.add(step_execution)
-                    session.commit()
-                    raise e
+                    close()
+
+    def _run_chunks(self, session: Session, step_execution_id: int, step, process_batch, metrics: ChunkMetrics):
+        """Read, process and write chunks sequentially until the reader is exhausted."""
+        while True:
+            chunk = step.reader.read_chunk(step.chunk_size)
+            if not chunk:
+                break  # No more items to process
+            metrics.read_count += len(chunk)
+            
+            processed_chunk = self._process_chunk(metrics, process_batch, chunk)
+            
+            # Write the processed chunk
+            if processed_chunk and step.writer:
+                with self._lock_backoff(metrics):
+                    step.writer.write(processed_chunk)
+                metrics.write_count += len(processed_chunk)
+            
+            self._complete_chunk(session, step_execution_id, step, metrics)
+
+    async def _run_chunks_async(self, session: Session, step_execution_id: int, step, process_batch, metrics: ChunkMetrics):
+        """Chunk loop that reads chunk K+1 while chunk K is being written.
+        
+        Sync readers and writers used alongside async ones are run in a worker
+        thread so they still overlap with the other side of the pipeline.
+        """
+        read_task = asyncio.create_task(self._read_chunk_async(step.reader, step.chunk_size))
+        write_task = None
+        
+        while True:
+            chunk = await read_task
+            if not chunk:
+                break  # No more items to process
+            metrics.read_count += len(chunk)
+            
+            # Prefetch the next chunk while this one is processed and written
+            read_task = asyncio.create_task(self._read_chunk_async(step.reader, step.chunk_size))
+            
+            processed_chunk = self._process_chunk(metrics, process_batch, chunk)
+            
+            if write_task is not None:
+                metrics.write_count += await write_task
+                self._complete_chunk(session, step_execution_id, step, metrics)
+            write_task = asyncio.create_task(self._write_chunk_async(step.writer, processed_chunk, metrics))
+        
+        if write_task is not None:
+            metrics.write_count += await write_task
+            self._complete_chunk(session, step_execution_id, step, metrics)
+
+    async def _read_chunk_async(self, reader, size: int) -> list:
+        from app.chunk import AsyncItemReader
+        
+        if isinstance(reader, AsyncItemReader):
+            return await reader.read_chunk(size)
+        return await asyncio.to_thread(reader.read_chunk, size)
+
+    async def _write_chunk_async(self, writer, items: list, metrics: ChunkMetrics) -> int:
+        """Write a processed chunk and return the number of items written."""
+        from app.chunk import AsyncItemWriter
+        
+        if not items or not writer:
+            return 0
+        with self._lock_backoff(metrics):
+            if isinstance(writer, AsyncItemWriter):
+                await writer.write(items)
+            else:
+                await asyncio.to_thread(writer.write, items)
+        return len(items)
+
+    @contextmanager
+    def _lock_backoff(self, metrics: ChunkMetrics):
+        """Halve the commit interval when a write fails on a database lock, then re-raise."""
+        try:
+            yield
+        except OperationalError as e:
+            if "lock" in str(e).lower():
+                metrics.commit_interval = max(1, metrics.commit_interval // 2)
+            raise
+
+    @staticmethod
+    def _resolve_process_batch(processor):
+        """Return a callable that processes a whole chunk and drops filtered items."""
+        # Processors with a batch hook (every ItemProcessor) handle the whole chunk in one call
+        process_batch = getattr(processor, 'process_batch', None)
+        if process_batch is not None:
+            return process_batch
+        
+        process = processor.process
+        return lambda chunk: [item for item in map(process, chunk) if item is not None]
+
+    def _process_chunk(self, metrics: ChunkMetrics, process_batch, chunk: list) -> list:
+        processed_chunk = process_batch(chunk)
+        metrics.filter_count += len(chunk) - len(processed_chunk)
+        return processed_chunk
+
+    def _complete_chunk(self, session: Session, step_execution_id: int, step, metrics: ChunkMetrics):
+        metrics.commit_count += 1
+        
+        # Commit every `commit_interval` chunks; the step end commits the rest
+        if metrics.commit_count % metrics.commit_interval == 0:
+            session.execute(UPDATE_STEP_COUNTERS, {
+                "sid": step_execution_id,
+                "r": metrics.read_count,
+                "w": metrics.write_count,
+                "f": metrics.filter_count,
+                "c": metrics.commit_count,
+            })
+            session.commit()
+
+    def _apply_metrics(self, step_execution: StepExecution, metrics: ChunkMetrics):
+        """Copy the in-memory counters onto the ORM row before its final commit."""
+        for name, value in metrics.as_dict().items():
+            setattr(step_execution, name, value)
@@ -1,14 +1,50 @@
-from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 sqlite_file_name = "batch.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
+async_sqlite_url = f"sqlite+aiosqlite:///{sqlite_file_name}"
 
 connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, echo=True, connect_args=connect_args)
+
+# Launchers open many short-lived sessions; reuse the most recently returned
+# connection (LIFO) so idle overflow connections can be recycled.
+pool_args = {
+    "pool_size": 20,
+    "max_overflow": 30,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+}
+
+# Sync engine used by the JobLauncher, which runs jobs outside the event loop
+engine = create_engine(sqlite_url, echo=True, connect_args=connect_args, **pool_args)
+# Objects stay loaded across commits so a job run doesn't re-SELECT them after every commit
+session_maker = sessionmaker(engine, class_=Session, expire_on_commit=False)
+
+# Async engine used by the API endpoints
+async_engine = create_async_engine(async_sqlite_url, echo=True, connect_args=connect_args)
+async_session_maker = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+# The job store sees many small commits: WAL halves the fsyncs per commit and
+# lets the API endpoints read while a job is writing.
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
-def get_session():
-    with Session(engine) as session:
+async def get_session():
+    async with async_session_maker() as session:
         yield session
@@ -1,10 +1,11 @@
 import time
 import random
 from datetime import datetime
-from app.core import Job, Step, ChunkStep
+import numpy as np
+from app.core import Job, Step, ChunkStep, ParallelStepGroup
 from app.chunk import (
     ListItemReader, 
-    FunctionItemProcessor, 
+    NumpyBatchProcessor,
     CallableItemWriter,
     ListItemWriter
 )
@@ -37,12 +38,10 @@ def parameterized_step_logic():
     print("Parameterized Step Complete")
 
 # Chunk processing functions
-def process_number(num: int) -> int:
-    """Example processor: square the number and filter out odd results."""
-    result = num * num
-    if result % 2 == 0:  # Only keep even squares
-        return result
-    return None  # Filter out odd squares
+def process_numbers(nums: np.ndarray) -> np.ndarray:
+    """Example processor: square the numbers and filter out odd results."""
+    squares = nums * nums
+    return squares[squares % 2 == 0]  # Only keep even squares
 
 # Output storage for demonstration
 chunk_output = []
@@ -87,6 +86,18 @@ parameterized_job = Job(
     ]
 )
 
+# Job whose independent steps run concurrently
+parallel_job = Job(
+    name="ParallelJob",
+    steps=[
+        ParallelStepGroup([
+            Step(name="Step1", task=step1_logic),
+            Step(name="Step2", task=step2_logic),
+        ]),
+        Step(name="FinalStep", task=parameterized_step_logic),
+    ]
+)
+
 # Chunk processing job
 chunk_job = Job(
     name="ChunkJob",
@@ -94,7 +105,7 @@ chunk_job = Job(
         ChunkStep(
             name="ProcessNumbers",
             reader=ListItemReader(list(range(1, 51))),  # Read numbers 1-50
-            processor=FunctionItemProcessor(process_number),  # Square and filter
+            processor=NumpyBatchProcessor(process_numbers, dtype=np.int64),  # Square and filter
             writer=CallableItemWriter(write_chunk),  # Write chunks
             chunk_size=10  # Process 10 items at a time
         )
@@ -107,5 +118,6 @@ job_registry = {
     "FailingJob": failing_job,
     "RetryJob": retry_job,
     "ParameterizedJob": parameterized_job,
+    "ParallelJob": parallel_job,
     "ChunkJob": chunk_job,
 }
@@ -0,0 +1,26 @@
+"""
+Logging for job execution.
+
+Records sent to the "batch" logger are only enqueued by the calling thread;
+a background QueueListener thread formats and writes them, so concurrent
+steps never contend on the stdout lock or pay for the write syscall.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger("batch")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(threadName)s] %(message)s"))
+
+listener = QueueListener(_log_queue, _handler)
+listener.start()
+atexit.register(listener.stop)
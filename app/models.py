@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlmodel import SQLModel, Field, Relationship, Column, JSON, Index
 from enum import Enum
 
 class BatchStatus(str, Enum):
@@ -32,6 +32,8 @@ class JobParameter(SQLModel, table=True):
     job_instance: JobInstance = Relationship(back_populates="parameters")
 
 class JobExecution(SQLModel, table=True):
+    __table_args__ = (Index("ix_je_instance", "job_instance_id"),)
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     job_instance_id: int = Field(foreign_key="jobinstance.id")
     status: BatchStatus = Field(default=BatchStatus.STARTING)
@@ -44,6 +46,9 @@ class JobExecution(SQLModel, table=True):
     step_executions: List["StepExecution"] = Relationship(back_populates="job_execution")
 
 class StepExecution(SQLModel, table=True):
+    # Covers the completed-steps lookup done on restart
+    __table_args__ = (Index("ix_se_je_status_name", "job_execution_id", "status", "step_name"),)
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     job_execution_id: int = Field(foreign_key="jobexecution.id")
     step_name: str
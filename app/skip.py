@@ -9,7 +9,13 @@ from typing import Set, Type, Optional
 from abc import ABC, abstractmethod
 
 class SkipPolicy(ABC):
-    """Abstract base class for skip policies."""
+    """Abstract base class for skip policies.
+    
+    Policies are consulted on the per-item exception path, so they are
+    slotted: attribute loads skip the instance `__dict__`.
+    """
+    
+    __slots__ = ()
     
     @abstractmethod
     def should_skip(self, exception: Exception, skip_count: int) -> bool:
@@ -17,20 +23,69 @@ class SkipPolicy(ABC):
         pass
 
 class NeverSkipPolicy(SkipPolicy):
-    """Never skip any exceptions - fail immediately."""
+    """Never skip any exceptions - fail immediately.
     
-    def should_skip(self, exception: Exception, skip_count: int) -> bool:
-        return False
+    `should_skip` is a slot holding a constant-returning lambda. The policy
+    is stateless, so prefer the shared `NEVER_SKIP` instance.
+    """
+    
+    __slots__ = ('should_skip',)
+    
+    def __init__(self):
+        self.should_skip = lambda exception, skip_count: False
 
 class AlwaysSkipPolicy(SkipPolicy):
-    """Always skip exceptions (dangerous - use with caution)."""
+    """Always skip exceptions (dangerous - use with caution).
     
-    def should_skip(self, exception: Exception, skip_count: int) -> bool:
-        return True
+    `should_skip` is a slot holding a constant-returning lambda. The policy
+    is stateless, so prefer the shared `ALWAYS_SKIP` instance.
+    """
+    
+    __slots__ = ('should_skip',)
+    
+    def __init__(self):
+        self.should_skip = lambda exception, skip_count: True
+
+# Shared instances of the stateless policies
+NEVER_SKIP = NeverSkipPolicy()
+ALWAYS_SKIP = AlwaysSkipPolicy()
+
+class ClassifyingSkipPolicy(SkipPolicy):
+    """Base for policies that skip a configured set of exception types.
+    
+    The types are also kept as a tuple so `isinstance` checks them all in a
+    single C-level call, and each exception type's verdict is cached after
+    its first check (up to `_CACHE_MAX` types) so repeat errors cost one dict
+    lookup. Assign a new set to `skippable_exceptions` to change them;
+    mutating the set in place does not update the tuple or the cache.
+    """
+    
+    __slots__ = ('_skippable_exceptions', '_exc_tuple', '_cache')
+    
+    _CACHE_MAX = 256
+    
+    @property
+    def skippable_exceptions(self) -> Set[Type[Exception]]:
+        return self._skippable_exceptions
+    
+    @skippable_exceptions.setter
+    def skippable_exceptions(self, value: Set[Type[Exception]]):
+        self._skippable_exceptions = value
+        self._exc_tuple = tuple(value)
+        self._cache = {}
+    
+    def _classify(self, exception: Exception) -> bool:
+        """Check `exception` against the configured types and cache the verdict."""
+        skippable = isinstance(exception, self._exc_tuple)
+        if len(self._cache) < self._CACHE_MAX:
+            self._cache[type(exception)] = skippable
+        return skippable
 
-class LimitCheckingSkipPolicy(SkipPolicy):
+class LimitCheckingSkipPolicy(ClassifyingSkipPolicy):
     """Skip exceptions up to a specified limit."""
     
+    __slots__ = ('skip_limit',)
+    
     def __init__(self, skip_limit: int = 10, skippable_exceptions: Optional[Set[Type[Exception]]] = None):
         self.skip_limit = skip_limit
         self.skippable_exceptions = skippable_exceptions or {Exception}
@@ -41,30 +96,55 @@ class LimitCheckingSkipPolicy(SkipPolicy):
             return False
         
         # Check if this exception type is skippable
-        for exc_type in self.skippable_exceptions:
-            if isinstance(exception, exc_type):
-                return True
-        
-        return False
+        skippable = self._cache.get(type(exception))
+        if skippable is None:
+            skippable = self._classify(exception)
+        return skippable
 
-class ExceptionClassifierSkipPolicy(SkipPolicy):
-    """Skip only specific exception types, with optional limit."""
+class ExceptionClassifierSkipPolicy(ClassifyingSkipPolicy):
+    """Skip only specific exception types, with optional limit.
+    
+    `should_skip` is specialized per instance: it is a slot holding a closure
+    built for the configured limit, so the common no-limit case is just the
+    type classification. Assigning `skippable_exceptions` or `skip_limit`
+    rebuilds it.
+    """
+    
+    __slots__ = ('_skip_limit', 'should_skip')
     
     def __init__(self, skippable_exceptions: Set[Type[Exception]], skip_limit: Optional[int] = None):
+        self._skip_limit = skip_limit
         self.skippable_exceptions = skippable_exceptions
-        self.skip_limit = skip_limit
     
-    def should_skip(self, exception: Exception, skip_count: int) -> bool:
-        # Check limit if specified
-        if self.skip_limit is not None and skip_count >= self.skip_limit:
-            return False
+    @ClassifyingSkipPolicy.skippable_exceptions.setter
+    def skippable_exceptions(self, value: Set[Type[Exception]]):
+        ClassifyingSkipPolicy.skippable_exceptions.fset(self, value)
+        self._specialize()
+    
+    @property
+    def skip_limit(self) -> Optional[int]:
+        return self._skip_limit
+    
+    @skip_limit.setter
+    def skip_limit(self, value: Optional[int]):
+        self._skip_limit = value
+        self._specialize()
+    
+    def _specialize(self):
+        cached = self._cache.get
+        classify = self._classify
+        skip_limit = self._skip_limit
         
-        # Check if exception type is skippable
-        for exc_type in self.skippable_exceptions:
-            if isinstance(exception, exc_type):
-                return True
+        def is_skippable(exception, skip_count):
+            skippable = cached(type(exception))
+            if skippable is None:
+                skippable = classify(exception)
+            return skippable
         
-        return False
+        if skip_limit is None:
+            self.should_skip = is_skippable
+        else:
+            self.should_skip = lambda exception, skip_count: skip_count < skip_limit and is_skippable(exception, skip_count)
 
 # Common exception types for skipping
 class SkippableException(Exception):